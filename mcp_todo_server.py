@@ -6,20 +6,76 @@ Supports CRUD operations with efficient sorted task management and CSV persisten
 
 import asyncio
 import csv
+import gc
 import json
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from bisect import bisect_left, insort
+from contextlib import contextmanager
+from dataclasses import dataclass, InitVar
+from bisect import bisect_left, bisect_right
+from operator import attrgetter, itemgetter
 import os
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
+# Column order of the CSV snapshot
+TASK_FIELDS = ['task_id', 'summary', 'details', 'is_recurring',
+               'recurrence_type', 'recurrence_value', 'due_time',
+               'alert_times', 'created_at']
+# Journal rows are snapshot rows prefixed with the operation ('create', 'update' or 'delete')
+JOURNAL_FIELDS = ['op'] + TASK_FIELDS
+# Buffer size for reading and writing the whole snapshot
+CSV_BUFFER_SIZE = 1 << 20
+
+# Recurrence types that advance by a fixed interval, and the unit for those taking a count
+RECURRENCE_DELTAS = {'daily': timedelta(days=1), 'weekly': timedelta(weeks=1)}
+RECURRENCE_UNITS = {'days': timedelta(days=1), 'weeks': timedelta(weeks=1)}
+
+def recurrence_delta(recurrence_type: Optional[str], recurrence_value: Optional[int]) -> Optional[timedelta]:
+    """Return the fixed interval of a recurrence, or None for calendar-based ones (months, years)"""
+    if recurrence_type in RECURRENCE_DELTAS:
+        return RECURRENCE_DELTAS[recurrence_type]
+    if recurrence_type in RECURRENCE_UNITS and recurrence_value:
+        return RECURRENCE_UNITS[recurrence_type] * recurrence_value
+    return None
+
+# Epoch for due_key(); naive so stored (local, naive) due times keep their wall-clock order
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+def to_local_naive(dt: datetime) -> datetime:
+    """Convert an aware datetime to naive local time, the form due times are stored in"""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone().replace(tzinfo=None)
+
+def due_key(dt: datetime) -> int:
+    """Exact integer sort key for a datetime: whole microseconds since the epoch, in local time"""
+    if dt.tzinfo is not None:
+        dt = to_local_naive(dt)
+    return (dt - EPOCH) // MICROSECOND
+
+class TaskCache:
+    """Slots for values Task derives from its fields; kept out of the dataclass fields so repr, == and asdict() ignore them"""
+    __slots__ = ('_due_dt', '_due_ts', '_alerts_json')
+
+@contextmanager
+def gc_paused():
+    """Suspend cyclic garbage collection while building many tasks at once"""
+    # Task objects hold no reference cycles, so collections triggered mid-batch only rescan live objects
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
 # Task data structure
-@dataclass(kw_only=True)
-class Task:
+@dataclass(kw_only=True, slots=True)
+class Task(TaskCache):
     task_id: str
     summary: str
     details: str
@@ -29,14 +85,36 @@ class Task:
     due_time: str  # ISO format datetime string
     alert_times: List[str]  # List of ISO format datetime strings
     created_at: str  # ISO format datetime string
+    due_dt: InitVar[Optional[datetime]] = None  # due_time already parsed by the caller, if any
+    alerts_json: InitVar[Optional[str]] = None  # alert_times as the JSON it was read from, if any
     
-    def __post_init__(self):
+    def __post_init__(self, due_dt: Optional[datetime], alerts_json: Optional[str]):
         if not self.alert_times:
             self.alert_times = [self.due_time]
+            alerts_json = None
+        # Parse due_time once; its exact integer key (microseconds) is the sort/search key
+        self._due_dt = due_dt if due_dt is not None else datetime.fromisoformat(self.due_time)
+        self._due_ts = due_key(self._due_dt)
+        # alert_times as stored in the CSV, serialized once rather than on every save
+        self._alerts_json = alerts_json if alerts_json is not None else json.dumps(self.alert_times)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the task fields; unlike asdict() it shares alert_times rather than deep-copying it"""
+        return {
+            'task_id': self.task_id,
+            'summary': self.summary,
+            'details': self.details,
+            'is_recurring': self.is_recurring,
+            'recurrence_type': self.recurrence_type,
+            'recurrence_value': self.recurrence_value,
+            'due_time': self.due_time,
+            'alert_times': self.alert_times,
+            'created_at': self.created_at,
+        }
     
     @property
     def due_datetime(self) -> datetime:
-        return datetime.fromisoformat(self.due_time)
+        return self._due_dt
     
     @property
     def created_datetime(self) -> datetime:
@@ -54,14 +132,22 @@ class TaskManager:
                 self.csv_file = script_dir /".data"/ "tasks.csv"
         else:
             self.csv_file = csv_file
+        # Mutations are appended to the journal and folded into the CSV snapshot by compact()
+        self.journal_file = f"{self.csv_file}.journal"
+        self._journal = None
+        self._journal_writer = None
+        self._journal_entries = 0
         self.tasks: List[Task] = []
+        # Due keys (microseconds, see due_key) kept in lockstep with self.tasks so bisect compares plain ints
+        self._due_keys: List[int] = []
+        # Hash index over self.tasks for constant-time lookup by task_id
+        self._by_id: Dict[str, Task] = {}
         self.load_from_csv()
         self.managed_timewindow = timedelta(days=5*365)  # Default to 5 years for task management
     
     def load_from_csv(self):
-        """Load tasks from CSV file at initialization"""
-        file_dir=os.path.dirname(self.csv_file)
-        if not os.path.exists(self.csv_file):
+        """Load tasks from the CSV snapshot and replay the journal on top of it"""
+        if not os.path.exists(self.csv_file) and not os.path.exists(self.journal_file):
             # if the target directory does not exist, create it
             file_dir=os.path.dirname(self.csv_file)
             if file_dir and not os.path.exists(file_dir):
@@ -70,126 +156,220 @@ class TaskManager:
         
         #clean up the tasks list
         self.tasks = []
+        self._due_keys = []
+        self._by_id = {}
+        self._journal_entries = 0
 
         try:
-            with open(self.csv_file, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    # Parse alert_times from JSON string
-                    alert_times = json.loads(row['alert_times']) if row['alert_times'] else []
-                    
-                    task = Task(
-                        task_id=row['task_id'],
-                        summary=row['summary'],
-                        details=row['details'],
-                        is_recurring=row['is_recurring'].lower() == 'true',
-                        recurrence_type=row['recurrence_type'] if row['recurrence_type'] else None,
-                        recurrence_value=int(row['recurrence_value']) if row['recurrence_value'] else None,
-                        due_time=row['due_time'],
-                        alert_times=alert_times,
-                        created_at=row['created_at']
-                    )
-                    self.tasks.append(task)
+            with gc_paused():
+                tasks_by_id: Dict[str, Task] = {}
+                torn_journal = False
+                if os.path.exists(self.csv_file):
+                    with open(self.csv_file, 'r', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as file:
+                        reader = csv.reader(file)
+                        header = next(reader, None)
+                        if header:
+                            # Resolve the column positions once from the header
+                            pick_fields = itemgetter(*(header.index(name) for name in TASK_FIELDS))
+                            for row in reader:
+                                task = self._task_from_fields(pick_fields(row))
+                                tasks_by_id[task.task_id] = task
+            
+                if os.path.exists(self.journal_file):
+                    # Journal rows have no header: the op column followed by TASK_FIELDS
+                    pick_fields = itemgetter(*range(1, len(JOURNAL_FIELDS)))
+                    # errors='replace' so a write cut inside a multi-byte character only spoils the row it tears
+                    with open(self.journal_file, 'r', newline='', encoding='utf-8', errors='replace') as file:
+                        rows = list(csv.reader(file))
+                    if rows and not self._journal_is_terminated():
+                        # An interrupted write leaves the last row without its line terminator,
+                        # possibly cut inside its final column; drop it rather than trust its column count
+                        rows.pop()
+                        torn_journal = True
+                    for row in rows:
+                        if len(row) != len(JOURNAL_FIELDS):
+                            # Skip a row torn by an interrupted write
+                            torn_journal = True
+                            continue
+                        self._journal_entries += 1
+                        if row[0] == 'delete':
+                            tasks_by_id.pop(row[1], None)
+                        else:
+                            task = self._task_from_fields(pick_fields(row))
+                            tasks_by_id[task.task_id] = task
             
             # Sort tasks by due time after loading
-            self.tasks.sort(key=lambda t: t.due_datetime)
+            tasks = list(tasks_by_id.values())
+            tasks.sort(key=attrgetter('_due_ts'))
+            self.tasks = tasks
+            self._due_keys = [task._due_ts for task in tasks]
+            self._by_id = tasks_by_id
+            
+            if torn_journal:
+                # Rewrite the snapshot so new journal rows don't append to the torn line
+                self.compact()
             
         except Exception as e:
             print(f"Error loading tasks from CSV: {e}")
     
-    def save_to_csv(self):
-        """Save tasks to CSV file"""
+    def _journal_is_terminated(self) -> bool:
+        """Check that the journal ends with a line terminator, i.e. its last row was written in full"""
+        with open(self.journal_file, 'rb') as file:
+            file.seek(0, os.SEEK_END)
+            if file.tell() == 0:
+                return True
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b'\n'
+    
+    def _task_from_fields(self, fields: Tuple[str, ...]) -> Task:
+        """Build a Task from CSV values in TASK_FIELDS order"""
+        (task_id, summary, details, is_recurring, recurrence_type,
+         recurrence_value, due_time, alert_times, created_at) = fields
+        
+        return Task(
+            task_id=task_id,
+            summary=summary,
+            details=details,
+            is_recurring=is_recurring.lower() == 'true',
+            recurrence_type=recurrence_type if recurrence_type else None,
+            recurrence_value=int(recurrence_value) if recurrence_value else None,
+            due_time=due_time,
+            # Parse alert_times from JSON string, keeping the string so saving needn't re-encode it
+            alert_times=json.loads(alert_times) if alert_times else [],
+            created_at=created_at,
+            alerts_json=alert_times or None
+        )
+    
+    def _task_to_row(self, task: Task) -> Tuple:
+        """Build a CSV row for a Task, in TASK_FIELDS order"""
+        return (task.task_id, task.summary, task.details, task.is_recurring,
+                task.recurrence_type, task.recurrence_value, task.due_time,
+                task._alerts_json, task.created_at)
+    
+    def save_to_csv(self) -> bool:
+        """Save all tasks to the CSV snapshot, atomically replacing the previous one"""
+        temp_file = f"{self.csv_file}.tmp"
         try:
-            with open(self.csv_file, 'w', newline='', encoding='utf-8') as file:
-                if not self.tasks:
-                    # Write empty file with headers
-                    writer = csv.writer(file)
-                    writer.writerow(['task_id', 'summary', 'details', 'is_recurring', 
-                                   'recurrence_type', 'recurrence_value', 'due_time', 
-                                   'alert_times', 'created_at'])
-                    return
-                
-                fieldnames = ['task_id', 'summary', 'details', 'is_recurring', 
-                            'recurrence_type', 'recurrence_value', 'due_time', 
-                            'alert_times', 'created_at']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for task in self.tasks:
-                    row = asdict(task)
-                    row['alert_times'] = json.dumps(row['alert_times'])
-                    writer.writerow(row)
+            with open(temp_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as file:
+                writer = csv.writer(file)
+                writer.writerow(TASK_FIELDS)
+                # writerows drains the generator in C, with no per-row dict
+                writer.writerows(self._task_to_row(task) for task in self.tasks)
+                # The journal is discarded after this, so the snapshot must be on disk before it replaces the old one
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_file, self.csv_file)
+            return True
        
         except Exception as e:
             print(f"Error saving tasks to CSV: {e}")
+            return False
+    
+    def _append_to_journal(self, op: str, tasks: List[Task]):
+        """Record a mutation by appending one journal row per task"""
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'a', newline='', encoding='utf-8')
+                self._journal_writer = csv.writer(self._journal)
+            self._journal_writer.writerows((op, *self._task_to_row(task)) for task in tasks)
+            self._journal.flush()
+            self._journal_entries += len(tasks)
+        except Exception as e:
+            print(f"Error writing tasks to journal: {e}")
+            return
+        
+        # Fold the journal into a fresh snapshot once it outgrows the live task list
+        if self._journal_entries > 2 * len(self.tasks):
+            self.compact()
     
-    def generate_task_id(self, due_time: datetime) -> str:
+    def compact(self):
+        """Write a fresh CSV snapshot and discard the journal it supersedes"""
+        if not self.save_to_csv():
+            return
+        self.close()
+        try:
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+            self._journal_entries = 0
+        except Exception as e:
+            print(f"Error removing journal: {e}")
+    
+    def close(self):
+        """Flush and close the journal file"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+            self._journal_writer = None
+    
+    def generate_task_id(self, due_time: datetime, task_uuid: Optional[uuid.UUID] = None) -> str:
         """Generate a unique task ID with format {UUID}_{dueTimestamp}"""
-        task_uuid = str(uuid.uuid4())
+        if task_uuid is None:
+            task_uuid = uuid.uuid4()
         timestamp = int(due_time.timestamp())
         return f"{task_uuid}_{timestamp}"
     
     def find_task_index(self, task_id: str) -> int:
-        """Efficiently find task index using binary search on timestamp"""
-        try:
-            # Extract timestamp from task_id
-            timestamp = int(task_id.split('_')[-1])
-            target_datetime = datetime.fromtimestamp(timestamp)
-            
-            # Binary search for the position
-            left, right = 0, len(self.tasks)-1
-            while left < right:
-                mid = (left + right) // 2
-                if self.tasks[mid].due_datetime < target_datetime:
-                    left = mid + 1
-                else:
-                    right = mid
-            
-            # Search forwards from left-1 to find exact match
-            for i in range(max(0, left - 1), len(self.tasks)):
-                if self.tasks[i].task_id == task_id:
-                    return i
-                if self.tasks[i].due_datetime > target_datetime:
-                    # If we passed the target, stop searching
-                    break
-            
-            return -1
-        except (ValueError, IndexError):
-            # Fallback to linear search if timestamp parsing fails
-            for i, task in enumerate(self.tasks):
-                if task.task_id == task_id:
-                    return i
+        """Efficiently find task index: hash lookup by id, then binary search on its due timestamp"""
+        task = self._by_id.get(task_id)
+        if task is None:
             return -1
+        
+        # Tasks sharing a due timestamp are adjacent; step to this one
+        i = bisect_left(self._due_keys, task._due_ts)
+        while self.tasks[i] is not task:
+            i += 1
+        return i
     
     def insert_task_sorted(self, task: Task):
         """Insert task maintaining sorted order by due time"""
+        # Tasks are usually added further out than any existing one; append those directly
+        if not self._due_keys or task._due_ts > self._due_keys[-1]:
+            self._due_keys.append(task._due_ts)
+            self.tasks.append(task)
+            self._by_id[task.task_id] = task
+            return
+        
         # Use binary search to find insertion point
-        insertion_point = bisect_left(self.tasks, task.due_datetime, key=lambda t: t.due_datetime)
+        insertion_point = bisect_left(self._due_keys, task._due_ts)
+        self._due_keys.insert(insertion_point, task._due_ts)
         self.tasks.insert(insertion_point, task)
+        self._by_id[task.task_id] = task
+    
+    def insert_tasks_sorted(self, tasks: List[Task]):
+        """Insert a batch of tasks with a single sort instead of one list.insert per task"""
+        self.tasks.extend(tasks)
+        self.tasks.sort(key=attrgetter('_due_ts'))
+        self._due_keys = [task._due_ts for task in self.tasks]
+        self._by_id.update((task.task_id, task) for task in tasks)
+    
+    def pop_task(self, index: int) -> Task:
+        """Remove and return the task at index, keeping the sort keys and id index in sync"""
+        self._due_keys.pop(index)
+        task = self.tasks.pop(index)
+        del self._by_id[task.task_id]
+        return task
     
     def calculate_next_due_time(self, task: Task) -> datetime:
         """Calculate the next due time for a recurring task"""
-        current_due = task.due_datetime
-        
-        if task.recurrence_type == 'daily':
-            return current_due + timedelta(days=1)
-        elif task.recurrence_type == 'weekly':
-            return current_due + timedelta(weeks=1)
-        elif task.recurrence_type == 'monthly':
+        return self.advance_due_time(task.due_datetime, task.recurrence_type, task.recurrence_value)
+    
+    def advance_due_time(self, current_due: datetime, recurrence_type: Optional[str],
+                         recurrence_value: Optional[int]) -> datetime:
+        """Calculate the due time that follows current_due for the given recurrence"""
+        delta = recurrence_delta(recurrence_type, recurrence_value)
+        if delta:
+            return current_due + delta
+        elif recurrence_type == 'monthly':
             # Add one month (approximate)
             if current_due.month == 12:
                 return current_due.replace(year=current_due.year + 1, month=1)
             else:
                 return current_due.replace(month=current_due.month + 1)
-        elif task.recurrence_type == 'yearly':
+        elif recurrence_type == 'yearly':
             return current_due.replace(year=current_due.year + 1)
-        elif task.recurrence_type == 'days' and task.recurrence_value:
-            return current_due + timedelta(days=task.recurrence_value)
-        elif task.recurrence_type == 'weeks' and task.recurrence_value:
-            return current_due + timedelta(weeks=task.recurrence_value)
-        elif task.recurrence_type == 'months' and task.recurrence_value:
+        elif recurrence_type == 'months' and recurrence_value:
             # Add specified number of months
-            months_to_add = task.recurrence_value
+            months_to_add = recurrence_value
             year = current_due.year
             month = current_due.month
             
@@ -202,10 +382,87 @@ class TaskManager:
         
         return current_due
     
+    def expand_recurrence(self, task: Task, now: Optional[datetime] = None) -> List[Task]:
+        """Create the occurrences of a recurring task that follow it within the managed time window"""
+        if now is None:
+            now = datetime.now()
+        # Fixed intervals are added directly; only months/years go through the calendar logic
+        delta = recurrence_delta(task.recurrence_type, task.recurrence_value)
+        horizon = now + self.managed_timewindow
+        due_times = []
+        next_due_time = self.calculate_next_due_time(task)
+        while next_due_time <= horizon:
+            due_times.append(next_due_time)
+            if delta:
+                next_due_time = next_due_time + delta
+            else:
+                next_due_time = self.advance_due_time(next_due_time, task.recurrence_type, task.recurrence_value)
+        
+        # Draw the random bytes for every occurrence's UUID4 with one urandom call rather than one per id
+        random_bytes = os.urandom(16 * len(due_times))
+        # Every occurrence is created together with the task, so they share its created_at
+        created_at = task.created_at
+        occurrences = []
+        with gc_paused():
+            for i, due in enumerate(due_times):
+                #create a new task for the next recurrence
+                due_iso = due.isoformat()
+                task_uuid = uuid.UUID(bytes=random_bytes[16 * i:16 * i + 16], version=4)
+                occurrences.append(Task(
+                    task_id=self.generate_task_id(due, task_uuid),
+                    summary=task.summary,
+                    details=task.details,
+                    is_recurring=True,
+                    recurrence_type=task.recurrence_type,
+                    recurrence_value=task.recurrence_value,
+                    due_time=due_iso,
+                    alert_times=[due_iso],
+                    created_at=created_at,
+                    due_dt=due
+                ))
+        return occurrences
+    
     def create_task(self, summary: str, details: str, is_recurring: bool,
                    recurrence_type: Optional[str], recurrence_value: Optional[int],
                    due_time: str, alert_times: Optional[List[str]] = None) -> Task:
         """Create a new task"""
+        new_tasks = self._build_tasks(summary, details, is_recurring, due_time,
+                                      recurrence_type, recurrence_value, alert_times)
+        
+        # Insert maintaining sorted order
+        if len(new_tasks) == 1:
+            self.insert_task_sorted(new_tasks[0])
+        else:
+            self.insert_tasks_sorted(new_tasks)
+        self._append_to_journal('create', new_tasks)
+        return new_tasks[0]
+    
+    def create_tasks(self, specs: List[Dict[str, Any]]) -> List[Task]:
+        """Create many tasks at once; each spec holds create_task's keyword arguments"""
+        # Validate and build everything first so a bad spec leaves the list untouched
+        created = []
+        new_tasks = []
+        # One clock reading for the whole batch, both for the future-time check and created_at
+        now = datetime.now()
+        with gc_paused():
+            for spec in specs:
+                tasks = self._build_tasks(**spec, now=now)
+                created.append(tasks[0])
+                new_tasks.extend(tasks)
+        
+        if new_tasks:
+            # One sort and one journal write for the whole batch
+            self.insert_tasks_sorted(new_tasks)
+            self._append_to_journal('create', new_tasks)
+        return created
+    
+    def _build_tasks(self, summary: str, details: str, is_recurring: bool, due_time: str,
+                     recurrence_type: Optional[str] = None, recurrence_value: Optional[int] = None,
+                     alert_times: Optional[List[str]] = None, now: Optional[datetime] = None) -> List[Task]:
+        """Validate a new task and build it, followed by its occurrences if recurring"""
+        if now is None:
+            now = datetime.now()
+        
         # Validate inputs
         if not summary.strip():
             raise ValueError("Task summary cannot be empty")
@@ -218,7 +475,7 @@ class TaskManager:
         except ValueError:
             raise ValueError("Invalid due time format. Use ISO format (YYYY-MM-DDTHH:MM:SS)")
         
-        if due_datetime <= datetime.now():
+        if due_datetime <= now:
             raise ValueError("Due time must be in the future")
         
         # Validate recurrence settings
@@ -233,7 +490,7 @@ class TaskManager:
                 raise ValueError(f"Recurrence value is required for {recurrence_type}")
         
         # Create task
-        created_at = datetime.now()
+        created_at = now
         task_id = self.generate_task_id(due_datetime)
         
         task = Task(
@@ -245,35 +502,16 @@ class TaskManager:
             recurrence_value=recurrence_value,
             due_time=due_time,
             alert_times=alert_times or [due_time],
-            created_at=created_at.isoformat()
+            created_at=created_at.isoformat(),
+            due_dt=due_datetime
         )
         
-        # Insert maintaining sorted order
-        self.insert_task_sorted(task)
-        self.save_to_csv() 
+        new_tasks = [task]
         
-        #calculate next due time if recurring
+        #create the following occurrences if recurring
         if is_recurring:
-            next_due_time = self.calculate_next_due_time(task)
-            while next_due_time <= datetime.now() + self.managed_timewindow:
-                #create a new task for the next recurrence
-                task2 = Task(
-                    task_id=self.generate_task_id(next_due_time),
-                    summary=task.summary,
-                    details=task.details,
-                    is_recurring=True,
-                    recurrence_type=task.recurrence_type,
-                    recurrence_value=task.recurrence_value,
-                    due_time=next_due_time.isoformat(),
-                    alert_times=[next_due_time.isoformat()],
-                    created_at=datetime.now().isoformat()
-                )
-                # Insert in sorted order
-                self.insert_task_sorted(task2)
-                next_due_time = self.calculate_next_due_time(task2)
-            self.save_to_csv()
-              
-        return task
+            new_tasks.extend(self.expand_recurrence(task, now))
+        return new_tasks
         
     def update_task(self, task_id: str, **kwargs) -> Task:
         """Update an existing task"""
@@ -310,8 +548,10 @@ class TaskManager:
                     raise ValueError("Due time must be in the future")
                 
                 # Remove task from current position
-                self.tasks.pop(index)
+                self.pop_task(index)
                 task.due_time = kwargs['due_time']
+                task._due_dt = due_datetime
+                task._due_ts = due_key(due_datetime)
                 # Re-insert in sorted order
                 self.insert_task_sorted(task)
             except ValueError as e:
@@ -319,8 +559,9 @@ class TaskManager:
         
         if 'alert_times' in kwargs:
             task.alert_times = kwargs['alert_times']
+            task._alerts_json = json.dumps(task.alert_times)
         
-        self.save_to_csv()
+        self._append_to_journal('update', [task])
         return task
     
     def delete_task(self, task_id: str) -> bool:
@@ -329,28 +570,30 @@ class TaskManager:
         if index == -1:
             return False
         
-        self.tasks.pop(index)
-        self.save_to_csv()
+        task = self.pop_task(index)
+        self._append_to_journal('delete', [task])
         return True
     
     def get_tasks_in_timeframe(self, start_time: str, end_time: str) -> List[Task]:
         """Get tasks within a time window"""
         try:
-            start_dt = datetime.fromisoformat(start_time)
-            end_dt = datetime.fromisoformat(end_time)
+            # Stored due times are naive local time; bring offset-qualified bounds (e.g. ...Z) onto the same clock
+            start_dt = to_local_naive(datetime.fromisoformat(start_time))
+            end_dt = to_local_naive(datetime.fromisoformat(end_time))
         except ValueError:
             raise ValueError("Invalid time format. Use ISO format (YYYY-MM-DDTHH:MM:SS)")
         
         if start_dt > end_dt:
             raise ValueError("Start time must be before end time")
         
-        # Binary search for start and end positions
-        start_idx = bisect_left(self.tasks, start_dt, key=lambda t: t.due_datetime)
-        end_idx = bisect_left(self.tasks, end_dt, key=lambda t: t.due_datetime)
-        
-        # Include tasks at end_dt
-        while end_idx < len(self.tasks) and self.tasks[end_idx].due_datetime <= end_dt:
-            end_idx += 1
+        return self.get_tasks_between(start_dt, end_dt)
+    
+    def get_tasks_between(self, start_dt: datetime, end_dt: datetime) -> List[Task]:
+        """Get tasks due within [start_dt, end_dt]"""
+        # Binary search the key column for start and end positions
+        start_idx = bisect_left(self._due_keys, due_key(start_dt))
+        # bisect_right lands past the last task due exactly at end_dt, so those are included
+        end_idx = bisect_right(self._due_keys, due_key(end_dt))
         
         return self.tasks[start_idx:end_idx]
     
@@ -360,8 +603,7 @@ class TaskManager:
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a specific task by ID"""
-        index = self.find_task_index(task_id)
-        return self.tasks[index] if index != -1 else None
+        return self._by_id.get(task_id)
 
     def delete_all_tasks(self) -> bool:
         """Delete all tasks"""
@@ -369,7 +611,9 @@ class TaskManager:
             return False
         
         self.tasks.clear()
-        self.save_to_csv()
+        self._due_keys.clear()
+        self._by_id.clear()
+        self.compact()
         return True
 
 # Initialize FastMCP server
@@ -411,7 +655,7 @@ def create_task(
             due_time=due_time,
             alert_times=alert_times
         )
-        # return asdict(task)
+        # return task.to_dict()
         # return a string with task details
         return f"Task created successfully: {task.summary} (ID: {task.task_id}, Due: {task.due_time})"
     except Exception as e:
@@ -444,7 +688,7 @@ def update_task(
         if not kwargs:
             return {"Skipped": "No fields to update. Provide at least one field to update."}
         task = task_manager.update_task(task_id, **kwargs)
-        return asdict(task)
+        return task.to_dict()
     except Exception as e:
         return {"error": str(e)}
 
@@ -479,7 +723,7 @@ def get_tasks_in_timeframe(start_time: str, end_time: str) -> Dict[str, Any]:
     """
     try:
         tasks = task_manager.get_tasks_in_timeframe(start_time, end_time)
-        return {"tasks": [asdict(task) for task in tasks]}
+        return {"tasks": [task.to_dict() for task in tasks]}
     except Exception as e:
         return {"error": str(e)}
 
@@ -493,7 +737,7 @@ def get_all_tasks() -> Dict[str, Any]:
     """
     try:
         tasks = task_manager.get_all_tasks()
-        return {"tasks": [asdict(task) for task in tasks]}
+        return {"tasks": [task.to_dict() for task in tasks]}
     except Exception as e:
         return {"error": str(e)}
 
@@ -511,7 +755,7 @@ def get_task(task_id: str) -> Dict[str, Any]:
     try:
         task = task_manager.get_task(task_id)
         if task:
-            return asdict(task)
+            return task.to_dict()
         else:
             return {"error": "Task not found"}
     except Exception as e:
@@ -532,11 +776,8 @@ def list_upcoming_tasks(days_ahead: int = 7) -> Dict[str, Any]:
         now = datetime.now()
         future_time = now + timedelta(days=days_ahead)
         
-        tasks = task_manager.get_tasks_in_timeframe(
-            now.isoformat(),
-            future_time.isoformat()
-        )
-        return {"tasks": [asdict(task) for task in tasks]}
+        tasks = task_manager.get_tasks_between(now, future_time)
+        return {"tasks": [task.to_dict() for task in tasks]}
     except Exception as e:
         return {"error": str(e)}
 
@@ -570,4 +811,7 @@ def delete_all_tasks() -> Dict[str, Any]:
 
 if __name__ == "__main__":
     # Run the MCP server
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        task_manager.close()
@@ -8,7 +8,9 @@ import unittest
 import tempfile
 import os
 import json
-from datetime import datetime, timedelta
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 import sys
 
@@ -21,18 +23,26 @@ from mcp_todo_server import TaskManager, Task
 class TestTaskManager(unittest.TestCase):
     """Unit tests for TaskManager class"""
     
-    def setUp(self):
-        """Set up test fixtures before each test method"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up one task manager shared by all test methods"""
         # Create a temporary CSV file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv')
-        self.temp_file.close()
-        self.task_manager = TaskManager(csv_file=self.temp_file.name)
+        cls.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv')
+        cls.temp_file.close()
+        cls.task_manager = TaskManager(csv_file=cls.temp_file.name)
     
-    def tearDown(self):
-        """Clean up after each test method"""
-        # Remove the temporary file
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all test methods"""
+        # Remove the temporary file and its journal
+        cls.task_manager.close()
+        for path in (cls.temp_file.name, cls.task_manager.journal_file):
+            if os.path.exists(path):
+                os.unlink(path)
+    
+    def setUp(self):
+        """Start each test method from an empty task list"""
+        self.task_manager.delete_all_tasks()
     
     def test_create_task_basic(self):
         """Test creating a basic one-off task"""
@@ -138,6 +148,100 @@ class TestTaskManager(unittest.TestCase):
         self.assertEqual(self.task_manager.tasks[1].task_id, task3.task_id)
         self.assertEqual(self.task_manager.tasks[2].task_id, task1.task_id)
     
+    def test_create_tasks_bulk(self):
+        """Test creating several tasks in one call"""
+        now = datetime.now()
+        
+        tasks = self.task_manager.create_tasks([
+            {"summary": "Later task", "details": "Due in three days", "is_recurring": False,
+             "due_time": (now + timedelta(days=3)).isoformat()},
+            {"summary": "Sooner task", "details": "Due tomorrow", "is_recurring": False,
+             "due_time": (now + timedelta(days=1)).isoformat()},
+        ])
+        
+        self.assertEqual([task.summary for task in tasks], ["Later task", "Sooner task"])
+        self.assertEqual([task.task_id for task in self.task_manager.tasks],
+                         [tasks[1].task_id, tasks[0].task_id])
+        
+        # A single invalid spec rejects the whole batch
+        with self.assertRaises(ValueError):
+            self.task_manager.create_tasks([
+                {"summary": "Valid", "details": "Valid", "is_recurring": False,
+                 "due_time": (now + timedelta(days=2)).isoformat()},
+                {"summary": "", "details": "Missing summary", "is_recurring": False,
+                 "due_time": (now + timedelta(days=2)).isoformat()},
+            ])
+        self.assertEqual(len(self.task_manager.tasks), 2)
+        
+        reloaded = TaskManager(csv_file=self.temp_file.name)
+        self.assertEqual(len(reloaded.tasks), 2)
+    
+    def test_sub_second_ordering(self):
+        """Test that due times within the same second keep their order and window edges"""
+        base = (datetime.now() + timedelta(days=1)).replace(microsecond=0)
+
+        task_a = self.task_manager.create_task(
+            summary="Task a", details="Due at +0.1s", is_recurring=False,
+            recurrence_type=None, recurrence_value=None,
+            due_time=(base + timedelta(milliseconds=100)).isoformat()
+        )
+        task_c = self.task_manager.create_task(
+            summary="Task c", details="Due at +0.9s", is_recurring=False,
+            recurrence_type=None, recurrence_value=None,
+            due_time=(base + timedelta(milliseconds=900)).isoformat()
+        )
+
+        self.assertEqual([t.task_id for t in self.task_manager.tasks], [task_a.task_id, task_c.task_id])
+
+        def window(start_ms, end_ms):
+            return self.task_manager.get_tasks_in_timeframe(
+                (base + timedelta(milliseconds=start_ms)).isoformat(),
+                (base + timedelta(milliseconds=end_ms)).isoformat()
+            )
+
+        self.assertEqual(window(500, 600), [])
+        self.assertEqual(window(100, 900), [task_a, task_c])
+        self.assertEqual(window(101, 900), [task_c])
+        self.assertEqual(window(100, 899), [task_a])
+
+    @unittest.skipUnless(hasattr(time, 'tzset'), "requires time.tzset")
+    def test_timeframe_with_aware_bounds(self):
+        """Test that offset-qualified window bounds are compared in local time"""
+        # Runs after patch.dict has restored TZ
+        self.addCleanup(time.tzset)
+        with patch.dict(os.environ, {'TZ': 'America/New_York'}):
+            time.tzset()
+            due = (datetime.now() + timedelta(days=1)).replace(hour=12, minute=0, second=0, microsecond=0)
+            task = self.task_manager.create_task(
+                summary="Noon task", details="Due at 12:00 local", is_recurring=False,
+                recurrence_type=None, recurrence_value=None, due_time=due.isoformat()
+            )
+
+            def window(start, end):
+                return self.task_manager.get_tasks_in_timeframe(start.isoformat(), end.isoformat())
+
+            # 11:00-13:00 local, written with the local offset and in UTC
+            start_local = (due - timedelta(hours=1)).astimezone()
+            end_local = (due + timedelta(hours=1)).astimezone()
+            self.assertEqual(window(start_local, end_local), [task])
+            self.assertEqual(window(start_local.astimezone(timezone.utc), end_local.astimezone(timezone.utc)), [task])
+
+            # 11:00Z-13:00Z is early morning in New York, before the task
+            self.assertEqual(window((due - timedelta(hours=1)).replace(tzinfo=timezone.utc),
+                                    (due + timedelta(hours=1)).replace(tzinfo=timezone.utc)), [])
+    
+    def test_task_to_dict(self):
+        """Test that to_dict matches dataclasses.asdict"""
+        future_time = (datetime.now() + timedelta(days=1)).isoformat()
+        
+        task = self.task_manager.create_task(
+            summary="Test task", details="Test details", is_recurring=True,
+            recurrence_type="weekly", recurrence_value=None, due_time=future_time,
+            alert_times=["2024-01-01T09:00:00"]
+        )
+        
+        self.assertEqual(task.to_dict(), asdict(task))
+    
     def test_find_task_by_id(self):
         """Test finding tasks by ID"""
         future_time = (datetime.now() + timedelta(days=1)).isoformat()
@@ -175,7 +279,30 @@ class TestTaskManager(unittest.TestCase):
         self.assertEqual(updated_task.summary, "Updated task")
         self.assertEqual(updated_task.details, "Updated details")
         self.assertEqual(updated_task.task_id, task.task_id)
-    
+
+    def test_update_task_due_time(self):
+        """Test that a task stays reachable by ID after its due time moves"""
+        now = datetime.now()
+
+        task = self.task_manager.create_task(
+            summary="Movable task", details="Due time will change", is_recurring=False,
+            recurrence_type=None, recurrence_value=None,
+            due_time=(now + timedelta(days=1)).isoformat()
+        )
+        other = self.task_manager.create_task(
+            summary="Other task", details="Stays in place", is_recurring=False,
+            recurrence_type=None, recurrence_value=None,
+            due_time=(now + timedelta(days=2)).isoformat()
+        )
+
+        new_due_time = (now + timedelta(days=3)).isoformat()
+        self.task_manager.update_task(task.task_id, due_time=new_due_time)
+
+        self.assertEqual(self.task_manager.tasks[0].task_id, other.task_id)
+        self.assertEqual(self.task_manager.get_task(task.task_id).due_time, new_due_time)
+        self.assertTrue(self.task_manager.delete_task(task.task_id))
+        self.assertEqual(len(self.task_manager.tasks), 1)
+
     def test_delete_task(self):
         """Test deleting a task"""
         future_time = (datetime.now() + timedelta(days=1)).isoformat()
@@ -254,6 +381,97 @@ class TestTaskManager(unittest.TestCase):
         self.assertEqual(loaded_task.is_recurring, task.is_recurring)
         self.assertEqual(loaded_task.recurrence_type, task.recurrence_type)
 
+    def _create_tasks(self, count):
+        """Create count one-off tasks due on consecutive days"""
+        now = datetime.now()
+        return [
+            self.task_manager.create_task(
+                summary=f"Task {i}", details=f"Details {i}", is_recurring=False,
+                recurrence_type=None, recurrence_value=None,
+                due_time=(now + timedelta(days=i + 1)).isoformat()
+            )
+            for i in range(count)
+        ]
+
+    def test_journal_replays_update_and_delete(self):
+        """Test that update and delete journal rows are replayed on reload"""
+        tasks = self._create_tasks(5)
+        new_due_time = (datetime.now() + timedelta(days=10)).isoformat()
+
+        self.task_manager.update_task(tasks[0].task_id, summary="Updated", due_time=new_due_time)
+        self.task_manager.delete_task(tasks[1].task_id)
+
+        # 7 journal rows for 4 live tasks: still below the compaction threshold
+        self.assertTrue(os.path.exists(self.task_manager.journal_file))
+
+        reloaded = TaskManager(csv_file=self.temp_file.name)
+        self.assertEqual(len(reloaded.tasks), 4)
+        self.assertIsNone(reloaded.get_task(tasks[1].task_id))
+        updated = reloaded.get_task(tasks[0].task_id)
+        self.assertEqual(updated.summary, "Updated")
+        self.assertEqual(updated.due_time, new_due_time)
+        # The moved task now sorts last
+        self.assertEqual(reloaded.tasks[-1].task_id, tasks[0].task_id)
+
+    def test_journal_compaction(self):
+        """Test that the journal is folded into the CSV once it exceeds twice the task count"""
+        task = self._create_tasks(1)[0]
+        self.task_manager.update_task(task.task_id, summary="Second")
+        # 2 journal rows for 1 task: not compacted yet
+        self.assertTrue(os.path.exists(self.task_manager.journal_file))
+
+        self.task_manager.update_task(task.task_id, summary="Third")
+        # 3 rows > 2 * 1 task: compacted into the snapshot and the journal removed
+        self.assertFalse(os.path.exists(self.task_manager.journal_file))
+
+        reloaded = TaskManager(csv_file=self.temp_file.name)
+        self.assertEqual(len(reloaded.tasks), 1)
+        self.assertEqual(reloaded.tasks[0].summary, "Third")
+
+    def test_journal_torn_row(self):
+        """Test that a torn last journal row is skipped and compacted away on reload"""
+        tasks = self._create_tasks(2)
+        self.task_manager.close()
+        with open(self.task_manager.journal_file, 'a', encoding='utf-8') as file:
+            file.write("create,partial-task-id,Torn")
+
+        reloaded = TaskManager(csv_file=self.temp_file.name)
+        self.assertEqual([t.task_id for t in reloaded.tasks], [t.task_id for t in tasks])
+        self.assertFalse(os.path.exists(self.task_manager.journal_file))
+
+        # New rows are not appended onto the torn line
+        reloaded.create_task(
+            summary="After torn row", details="Written after recovery", is_recurring=False,
+            recurrence_type=None, recurrence_value=None,
+            due_time=(datetime.now() + timedelta(days=5)).isoformat()
+        )
+        reloaded.close()
+        self.assertEqual(len(TaskManager(csv_file=self.temp_file.name).tasks), 3)
+
+    def test_journal_row_torn_in_last_column(self):
+        """Test that a last journal row cut inside created_at is dropped even though it has every column"""
+        tasks = self._create_tasks(3)
+        self.task_manager.close()
+        with open(self.task_manager.journal_file, 'rb+') as file:
+            file.seek(-8, os.SEEK_END)
+            file.truncate()
+
+        reloaded = TaskManager(csv_file=self.temp_file.name)
+        self.assertEqual([t.task_id for t in reloaded.tasks], [t.task_id for t in tasks[:2]])
+        self.assertFalse(os.path.exists(self.task_manager.journal_file))
+
+        # The create acknowledged after recovery survives the next reload
+        after = reloaded.create_task(
+            summary="After torn row", details="Written after recovery", is_recurring=False,
+            recurrence_type=None, recurrence_value=None,
+            due_time=(datetime.now() + timedelta(days=5)).isoformat()
+        )
+        reloaded.close()
+        self.assertEqual(
+            [t.task_id for t in TaskManager(csv_file=self.temp_file.name).tasks],
+            [t.task_id for t in tasks[:2]] + [after.task_id]
+        )
+
 class TestMCPTools(unittest.TestCase):
     """Integration tests for MCP tools"""
 
@@ -387,9 +605,11 @@ def run_manual_tests():
         traceback.print_exc()
     
     finally:
-        # Clean up test file
-        if os.path.exists("test_manual.csv"):
-            os.unlink("test_manual.csv")
+        # Clean up test files
+        test_manager.close()
+        for path in ("test_manual.csv", test_manager.journal_file):
+            if os.path.exists(path):
+                os.unlink(path)
 
 
 def run_performance_tests():
@@ -407,15 +627,15 @@ def run_performance_tests():
         start_time = time.time()
         
         now = datetime.now()
-        for i in range(1000):
-            test_manager.create_task(
-                summary=f"Task {i}",
-                details=f"Details for task {i}",
-                is_recurring=False,
-                recurrence_type=None,
-                recurrence_value=None,
-                due_time=(now + timedelta(days=i % 30+1)).isoformat()
-            )
+        test_manager.create_tasks([
+            {
+                "summary": f"Task {i}",
+                "details": f"Details for task {i}",
+                "is_recurring": False,
+                "due_time": (now + timedelta(days=i % 30+1)).isoformat()
+            }
+            for i in range(1000)
+        ])
         
         create_time = time.time() - start_time
         print(f"Created 1000 tasks in {create_time:.2f} seconds")
@@ -441,8 +661,10 @@ def run_performance_tests():
         traceback.print_exc()
     
     finally:
-        if os.path.exists("test_performance.csv"):
-            os.unlink("test_performance.csv")
+        test_manager.close()
+        for path in ("test_performance.csv", test_manager.journal_file):
+            if os.path.exists(path):
+                os.unlink(path)
 
 
 if __name__ == "__main__":
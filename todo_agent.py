@@ -12,6 +12,9 @@ import asyncio
 
 load_dotenv()
 
+# Number of recent user/assistant exchanges re-sent to the model each turn
+MAX_HISTORY_TURNS = max(1, int(os.getenv("MAX_HISTORY_TURNS", "20")))
+
 # Initialize Azure-backed LLM
 llm = AzureChatOpenAI(
     azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT"),
@@ -55,7 +58,8 @@ async def main():
 
             while True:
                 #create a simple REPL for user input
-                user_input = input("\nYou: ").strip()
+                # read in a worker thread so the event loop (and the MCP session) isn't blocked while waiting
+                user_input = (await asyncio.to_thread(input, "\nYou: ")).strip()
                 if user_input.lower() in ['quit', 'exit', 'q']:
                     print("Agent: Goodbye! 👋")
                     break
@@ -68,6 +72,8 @@ async def main():
                     # Add agent response to history
                     agent_message = response["messages"][-1].content
                     conversation_history.append(("assistant", agent_message))
+                    # Keep only the latest turns so the prompt (and its latency/cost) stays bounded
+                    del conversation_history[:-2 * MAX_HISTORY_TURNS]
                     print(f"Agent: {agent_message}")
                         
 